@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import Base
+from main import PriorityCalculator
+
+# Shared calculator; it holds no per-test state
+@pytest.fixture(scope="module")
+def calculator():
+    return PriorityCalculator()
+
+# One in-memory database for the whole test run; StaticPool hands every
+# session the same connection so the schema is only created once
+@pytest.fixture(scope="session")
+def db_engine():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so savepoints work with pysqlite
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+# Each test runs inside a transaction that is rolled back afterwards;
+# commits made by the test only release a savepoint
+@pytest.fixture
+def db_session(db_engine):
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint"
+    )
+
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
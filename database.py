@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, Date, ForeignKey, Table
+from sqlalchemy import create_engine, event, func, inspect, select, text, Column, Integer, String, Date, ForeignKey, Table, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 import os
@@ -10,6 +10,26 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./instance/tasks.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+# SQLite tuning applied to every new connection: WAL lets readers and the
+# writer proceed concurrently, and busy_timeout waits out locks instead of
+# failing immediately with "database is locked"
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "busy_timeout=5000",
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "foreign_keys=ON",
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -19,7 +39,11 @@ task_dependencies = Table(
     'task_dependencies',
     Base.metadata,
     Column('task_id', String, ForeignKey('tasks.id')),
-    Column('depends_on_id', String, ForeignKey('tasks.id'))
+    Column('depends_on_id', String, ForeignKey('tasks.id')),
+    # Reverse lookup: which tasks depend on a given task
+    Index('ix_taskdeps_depends_on', 'depends_on_id'),
+    # Forward lookup: does a task still have pending dependencies
+    Index('ix_taskdeps_task', 'task_id')
 )
 
 class TaskDB(Base):
@@ -32,19 +56,70 @@ class TaskDB(Base):
     importance = Column(Integer)
     score = Column(Integer, nullable=True)
     explanation = Column(String, nullable=True)
+    # Day the stored score was computed with the default weights; NULL when
+    # the score is missing or stale and must be recomputed
+    scored_on = Column(Date, nullable=True)
+    # Number of tasks that depend on this one, kept up to date when tasks are
+    # created or deleted so scoring does not have to count the link table
+    dependents_count = Column(Integer, nullable=False, default=0, server_default=text('0'))
     
-    # Self-referential relationship for dependencies
+    # Self-referential relationship for dependencies, eager-loaded with one
+    # extra SELECT ... IN per collection instead of one lazy load per row
     dependencies = relationship(
         'TaskDB',
         secondary=task_dependencies,
         primaryjoin=(id == task_dependencies.c.task_id),
         secondaryjoin=(id == task_dependencies.c.depends_on_id),
-        backref="depends_on_me"
+        back_populates="depends_on_me",
+        lazy="selectin",
+        join_depth=1
     )
+    depends_on_me = relationship(
+        'TaskDB',
+        secondary=task_dependencies,
+        primaryjoin=(id == task_dependencies.c.depends_on_id),
+        secondaryjoin=(id == task_dependencies.c.task_id),
+        back_populates="dependencies",
+        lazy="selectin",
+        join_depth=1
+    )
+
+# Index used by the suggestions query (highest scores first)
+Index('ix_tasks_score_desc', TaskDB.score.desc())
 
 # Create tables
 def init_db():
     Base.metadata.create_all(bind=engine)
+    _upgrade_schema()
+
+def _upgrade_schema():
+    """Add columns and indexes that are missing from tables created by an older version"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            added = False
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    default = f' DEFAULT {column.server_default.arg.text}' if column.server_default is not None else ''
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}{default}'))
+                    added = added or column.name == 'dependents_count'
+            if added:
+                refresh_dependents_count(conn)
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+def refresh_dependents_count(conn):
+    """Recount the dependents of every task from the association table"""
+    conn.execute(
+        TaskDB.__table__.update().values(
+            dependents_count=select(func.count())
+            .select_from(task_dependencies)
+            .where(task_dependencies.c.depends_on_id == TaskDB.id)
+            .scalar_subquery()
+        )
+    )
 
 # Dependency
 def get_db():
@@ -1,23 +1,30 @@
 from fastapi import FastAPI, HTTPException, Depends, status, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Optional, Dict, Any, Tuple, Union
 from datetime import datetime, date, timedelta
 import json
 from enum import Enum
+import os
 import uuid
-from collections import defaultdict
-from sqlalchemy.orm import Session
+import bisect
+import functools
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from sqlalchemy import case, exists, func, or_, select
+from sqlalchemy.orm import Session, selectinload
 
 # Import database models and functions
-from database import TaskDB, get_db, init_db, engine, SessionLocal
+from database import TaskDB, task_dependencies, get_db, init_db, engine, SessionLocal
 
 # Initialize database tables
 init_db()
 
 app = FastAPI(title="Task Priority API",
               description="API for intelligent task prioritization",
-              version="1.1.0")
+              version="1.1.0",
+              default_response_class=ORJSONResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -52,10 +59,19 @@ class TaskCreate(TaskBase):
     pass
 
 class Task(TaskBase):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     score: Optional[float] = None
     explanation: Optional[str] = None
 
+class TaskId(BaseModel):
+    id: str
+
+class BulkTaskCreate(BaseModel):
+    tasks: List[TaskCreate]
+
+class BulkTaskDelete(BaseModel):
+    ids: List[str]
+
 class AnalysisRequest(BaseModel):
     tasks: List[TaskCreate]
     weights: Optional[PriorityWeights] = None
@@ -65,162 +81,266 @@ class AnalysisResponse(BaseModel):
     strategy: str
     weights: Optional[Dict[str, float]] = None
 
+@dataclass
+class _ScoringTask:
+    """Slotted task record used by analyze_tasks while validating and scoring
+
+    Avoids building a Pydantic model for every task; only the tasks that are
+    returned are converted to ``Task``.
+    """
+    __slots__ = ('id', 'title', 'due_date', 'estimated_hours', 'importance',
+                 'dependencies', 'score', 'explanation')
+    id: str
+    title: str
+    due_date: date
+    estimated_hours: float
+    importance: int
+    dependencies: Tuple[str, ...]
+    score: Optional[float]
+    explanation: Optional[str]
+
+    @classmethod
+    def from_db(cls, task_db: TaskDB) -> "_ScoringTask":
+        return cls(task_db.id, task_db.title, task_db.due_date, task_db.estimated_hours,
+                   task_db.importance, tuple(dep.id for dep in task_db.dependencies),
+                   task_db.score, task_db.explanation)
+
+    def to_task(self) -> Task:
+        return Task.model_construct(
+            id=self.id, title=self.title, due_date=self.due_date,
+            estimated_hours=self.estimated_hours, importance=self.importance,
+            dependencies=list(self.dependencies), score=self.score,
+            explanation=self.explanation
+        )
+
+def generate_task_ids(n: int) -> List[str]:
+    """Generate n random 32-character hex task IDs from a single urandom draw"""
+    data = os.urandom(16 * n)
+    return [data[i:i + 16].hex() for i in range(0, 16 * n, 16)]
+
 # Priority calculation
+# Score lookup tables: a value scores _SCORE[i] where i is the first
+# threshold it does not exceed (bisect_left), the last entry otherwise
+_URGENCY_THRESHOLDS = (-1, 0, 1, 3, 7, 14, 30)  # days until due
+_URGENCY_SCORES = (100.0, 90.0, 80.0, 70.0, 50.0, 30.0, 20.0, 10.0)
+_EFFORT_THRESHOLDS = (1, 4, 8, 16)  # estimated hours
+_EFFORT_SCORES = (100.0, 80.0, 60.0, 40.0, 20.0)
+
+@functools.lru_cache(maxsize=1024)
+def _urgency_bucket(days_until_due: int) -> int:
+    """Index into the urgency tables for a number of days until due"""
+    return bisect.bisect_left(_URGENCY_THRESHOLDS, days_until_due)
+
+@functools.lru_cache(maxsize=1024)
+def _effort_bucket(estimated_hours: float) -> int:
+    """Index into the effort tables for a number of estimated hours"""
+    return bisect.bisect_left(_EFFORT_THRESHOLDS, estimated_hours)
+
+# Explanation fragments, built once at import
+_EXPLAIN_PAST_DUE = "⚠️ Past due by %d days"
+_EXPLAIN_DUE_TODAY = "⏰ Due today"
+_EXPLAIN_DUE_SOON = "⏳ Due in %d days"
+_EXPLAIN_HIGH_IMPORTANCE = "⭐ High importance"
+_EXPLAIN_LOW_IMPORTANCE = "🔽 Low importance"
+_EXPLAIN_QUICK = "⚡ Quick task"
+_EXPLAIN_SLOW = "🐢 Time-consuming"
+_EXPLAIN_DEPENDS_ON = "🔗 Depends on %d tasks"
+_EXPLAIN_BLOCKS_ONE = "🔑 Blocks 1 other task"
+_EXPLAIN_BLOCKS_MANY = "🔑 Blocks %d other tasks"
+_EXPLAIN_NONE = "No specific factors identified"
+
+def dependency_id(dep: Union[str, Task, TaskDB]) -> str:
+    """Return the task ID of a dependency given as an ID or a task object"""
+    return dep.id if hasattr(dep, 'id') else dep
+
+def count_dependents(tasks) -> Dict[str, int]:
+    """Count, in one pass, how many of the given tasks depend on each task ID"""
+    rev_count = defaultdict(int)
+    for task in tasks:
+        for dep in task.dependencies or []:
+            rev_count[dependency_id(dep)] += 1
+    return rev_count
+
 class PriorityCalculator:
     def __init__(self, weights: Optional[PriorityWeights] = None):
         self.weights = weights or PriorityWeights()
+        self.weights_dict = self.weights.model_dump()
+        
+        # Unpack the weights once and pre-multiply them into the lookup tables
+        self._w = (self.weights.urgency, self.weights.importance,
+                   self.weights.effort, self.weights.dependencies)
+        w_urgency, w_importance, w_effort, w_dependencies = self._w
+        self._urgency_table = tuple(w_urgency * score for score in _URGENCY_SCORES)
+        self._effort_table = tuple(w_effort * score for score in _EFFORT_SCORES)
+        self._importance_factor = w_importance * 10.0  # Scale 1-10 to 10-100
+        self._dependency_bonus = w_dependencies * 100.0  # Blocks other tasks
 
-    def calculate_score(self, task: Task, all_tasks: Dict[str, Task]) -> float:
-        """Calculate priority score for a task (0-100 scale)"""
-        # Normalize values
-        urgency_score = self._calculate_urgency_score(task.due_date)
-        importance_score = (task.importance / 10.0) * 100  # Scale 1-10 to 10-100
-        effort_score = self._calculate_effort_score(task.estimated_hours)
-        dependency_score = self._calculate_dependency_score(task, all_tasks)
-
-        # Apply weights
-        score = (
-            self.weights.urgency * urgency_score +
-            self.weights.importance * importance_score +
-            self.weights.effort * effort_score +
-            self.weights.dependencies * dependency_score
-        )
+    def calculate_score(self, task: Task, all_tasks: Dict[str, Task],
+                        rev_count: Optional[Dict[str, int]] = None,
+                        today: Optional[date] = None) -> float:
+        """Calculate priority score for a task (0-100 scale)
+
+        Pass ``rev_count`` from ``count_dependents`` when scoring many tasks
+        so the dependents are not recounted for every task.
+        """
+        if rev_count is None:
+            rev_count = count_dependents(all_tasks.values())
+        
+        return self.calculate_scores([task], rev_count, today)[0]
 
-        return min(max(score, 0), 100)  # Ensure score is between 0-100
+    def calculate_scores(self, tasks: List[Task], rev_count: Dict[str, int],
+                         today: Optional[date] = None) -> List[float]:
+        """Calculate priority scores for a batch of tasks in a single pass
 
-    def _calculate_urgency_score(self, due_date: date) -> float:
+        The urgency and effort tables are pre-multiplied by their weights
+        in ``__init__`` and the bucket lookups are memoized, so each task
+        costs two cached lookups, one multiply and a few additions.
+        """
+        if today is None:
+            today = date.today()
+        urgency_table = self._urgency_table
+        effort_table = self._effort_table
+        importance_factor = self._importance_factor
+        dependency_bonus = self._dependency_bonus
+        
+        scores = []
+        for task in tasks:
+            score = (
+                urgency_table[_urgency_bucket((task.due_date - today).days)] +
+                importance_factor * task.importance +
+                effort_table[_effort_bucket(task.estimated_hours)]
+            )
+            if rev_count.get(task.id, 0) > 0:
+                score += dependency_bonus
+            scores.append(min(max(score, 0), 100))  # Ensure score is between 0-100
+        
+        return scores
+
+    def _calculate_urgency_score(self, due_date: date, today: date) -> float:
         """Calculate urgency score based on due date"""
-        today = date.today()
         days_until_due = (due_date - today).days
-        
-        if days_until_due < 0:
-            # Past due - high urgency
-            return 100.0
-        elif days_until_due == 0:
-            # Due today
-            return 90.0
-        elif days_until_due <= 1:
-            # Due tomorrow
-            return 80.0
-        elif days_until_due <= 3:
-            # Due in 2-3 days
-            return 70.0
-        elif days_until_due <= 7:
-            # Due this week
-            return 50.0
-        elif days_until_due <= 14:
-            # Due in 2 weeks
-            return 30.0
-        elif days_until_due <= 30:
-            # Due this month
-            return 20.0
-        else:
-            # Not urgent
-            return 10.0
+        # Past due 100, today 90, tomorrow 80, 2-3 days 70, this week 50,
+        # 2 weeks 30, this month 20, later 10
+        return _URGENCY_SCORES[_urgency_bucket(days_until_due)]
 
     def _calculate_effort_score(self, estimated_hours: float) -> float:
         """Calculate score based on effort (lower effort = higher score)"""
-        if estimated_hours <= 1:
-            return 100.0  # Quick win
-        elif estimated_hours <= 4:
-            return 80.0
-        elif estimated_hours <= 8:
-            return 60.0
-        elif estimated_hours <= 16:
-            return 40.0
-        else:
-            return 20.0  # Large tasks get lower score
-
-    def _calculate_dependency_score(self, task: Task, all_tasks: Dict[str, Task]) -> float:
-        """Calculate score based on how many tasks depend on this one"""
-        if not task.dependencies:
-            return 0.0
-            
-        # Check if any other tasks depend on this one
-        dependent_count = sum(1 for t in all_tasks.values() if task.id in t.dependencies)
-        
-        if dependent_count > 0:
-            return 100.0  # High score if other tasks depend on this one
-        return 0.0
+        # <=1h is a quick win (100), >16h gets the lowest score (20)
+        return _EFFORT_SCORES[_effort_bucket(estimated_hours)]
 
-    def generate_explanation(self, task: Task, all_tasks: Dict[str, Task]) -> str:
+    def generate_explanation(self, task: Task, all_tasks: Dict[str, Task],
+                             rev_count: Optional[Dict[str, int]] = None,
+                             today: Optional[date] = None) -> str:
         """Generate a human-readable explanation of the priority score"""
+        if rev_count is None:
+            rev_count = count_dependents(all_tasks.values())
+        if today is None:
+            today = date.today()
+        
         explanations = []
         
         # Urgency explanation
-        today = date.today()
         days_until_due = (task.due_date - today).days
         if days_until_due < 0:
-            explanations.append(f"⚠️ Past due by {-days_until_due} days")
+            explanations.append(_EXPLAIN_PAST_DUE % -days_until_due)
         elif days_until_due == 0:
-            explanations.append("⏰ Due today")
+            explanations.append(_EXPLAIN_DUE_TODAY)
         elif days_until_due <= 3:
-            explanations.append(f"⏳ Due in {days_until_due} days")
+            explanations.append(_EXPLAIN_DUE_SOON % days_until_due)
             
         # Importance explanation
         if task.importance >= 8:
-            explanations.append("⭐ High importance")
+            explanations.append(_EXPLAIN_HIGH_IMPORTANCE)
         elif task.importance <= 3:
-            explanations.append("🔽 Low importance")
+            explanations.append(_EXPLAIN_LOW_IMPORTANCE)
             
         # Effort explanation
         if task.estimated_hours <= 2:
-            explanations.append("⚡ Quick task")
+            explanations.append(_EXPLAIN_QUICK)
         elif task.estimated_hours >= 8:
-            explanations.append("🐢 Time-consuming")
+            explanations.append(_EXPLAIN_SLOW)
             
         # Dependencies explanation
         if task.dependencies:
-            explanations.append(f"🔗 Depends on {len(task.dependencies)} tasks")
+            explanations.append(_EXPLAIN_DEPENDS_ON % len(task.dependencies))
             
         # Check if other tasks depend on this one
-        dependent_count = sum(1 for t in all_tasks.values() if task.id in t.dependencies)
-        if dependent_count > 0:
-            explanations.append(f"🔑 Blocks {dependent_count} other task{'s' if dependent_count > 1 else ''}")
+        dependent_count = rev_count.get(task.id, 0)
+        if dependent_count == 1:
+            explanations.append(_EXPLAIN_BLOCKS_ONE)
+        elif dependent_count > 1:
+            explanations.append(_EXPLAIN_BLOCKS_MANY % dependent_count)
             
-        return ", ".join(explanations) if explanations else "No specific factors identified"
+        return ", ".join(explanations) if explanations else _EXPLAIN_NONE
+
+def analyze_graph(tasks: List[Union[Task, TaskDB, _ScoringTask]]) -> Tuple[List[str], Dict[str, int], Dict[str, List[str]]]:
+    """Analyze the dependency graph of tasks in a single pass over its edges
+
+    Returns the task IDs in topological order (dependencies first), the
+    number of dependents per task ID and the dependency -> dependents
+    adjacency within the batch. Raises HTTPException on a cycle.
+    """
+    indeg = {task.id: 0 for task in tasks}
+    adj = defaultdict(list)
+    rev_count = defaultdict(int)
+    for task in tasks:
+        for dep in getattr(task, 'dependencies', None) or []:
+            dep_id = dependency_id(dep)
+            rev_count[dep_id] += 1
+            if dep_id in indeg:
+                indeg[task.id] += 1
+                adj[dep_id].append(task.id)
+    
+    # Common case: no task depends on another one in the batch, so any order
+    # is topological and there can be no cycle
+    if not adj:
+        return list(indeg), rev_count, adj
+    
+    # Kahn's algorithm: a cycle exists iff some task is never emitted
+    queue = deque(task_id for task_id, degree in indeg.items() if degree == 0)
+    topo_order = []
+    while queue:
+        node = queue.popleft()
+        topo_order.append(node)
+        for dependent in adj[node]:
+            indeg[dependent] -= 1
+            if indeg[dependent] == 0:
+                queue.append(dependent)
+    
+    if len(topo_order) < len(indeg):
+        task_id = next(task_id for task_id, degree in indeg.items() if degree > 0)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Circular dependency detected involving task {task_id}"
+        )
+    
+    return topo_order, rev_count, adj
 
-def validate_tasks(db: Session, tasks: List[Union[Task, TaskDB]], task_ids: set = None) -> None:
-    """Validate tasks and their dependencies"""
+def validate_tasks(db: Session, tasks: List[Union[Task, TaskDB, _ScoringTask]], task_ids: set = None
+                   ) -> Tuple[List[str], Dict[str, int], Dict[str, List[str]]]:
+    """Validate tasks and their dependencies, returning the analyze_graph result"""
     if task_ids is None:
         task_ids = {task.id for task in tasks}
     
-    # Check for circular dependencies
-    graph = {}
-    for task in tasks:
-        if hasattr(task, 'dependencies'):
-            deps = [dep.id if hasattr(dep, 'id') else dep for dep in task.dependencies]
-            graph[task.id] = set(deps)
+    topo_order, rev_count, adj = analyze_graph(tasks)
     
-    def has_cycle(node, visited, rec_stack):
-        visited.add(node)
-        rec_stack.add(node)
-        
-        for neighbor in graph.get(node, set()):
-            if neighbor not in task_ids:
-                # Check if task exists in database
-                if not db.query(TaskDB).filter(TaskDB.id == neighbor).first():
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Task {node} depends on non-existent task {neighbor}"
-                    )
-            if neighbor not in visited:
-                if has_cycle(neighbor, visited, rec_stack):
-                    return True
-            elif neighbor in rec_stack:
-                return True
-                
-        rec_stack.remove(node)
-        return False
+    # Check that dependencies outside the batch exist, in a single query
+    external = [dep_id for dep_id in rev_count if dep_id not in task_ids]
+    if external:
+        found = {row.id for row in db.query(TaskDB.id).filter(TaskDB.id.in_(external)).all()}
+        missing = set(external) - found
+        if missing:
+            task, dep_id = next(
+                (task, dependency_id(dep)) for task in tasks
+                for dep in getattr(task, 'dependencies', None) or []
+                if dependency_id(dep) in missing
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Task {task.id} depends on non-existent task {dep_id}"
+            )
     
-    for task in tasks:
-        visited = set()
-        if task.id not in visited:
-            if has_cycle(task.id, visited, set()):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Circular dependency detected involving task {task.id}"
-                )
+    return topo_order, rev_count, adj
 
 # API Endpoints
 # Helper function to convert DB model to Pydantic model
@@ -235,28 +355,56 @@ def task_db_to_pydantic(task_db: TaskDB) -> Task:
         'explanation': task_db.explanation,
         'dependencies': [dep.id for dep in task_db.dependencies]
     }
-    return Task(**task_dict)
+    # Rows were validated when they were stored; skip re-validation
+    return Task.model_construct(**task_dict)
+
+def build_db_tasks(db: Session, tasks: List[TaskBase], task_ids: List[str]) -> List[TaskDB]:
+    """Build database rows for new tasks, attaching their existing dependencies"""
+    # Fetch the dependencies of all tasks with a single IN query
+    dep_ids = {dep_id for task in tasks for dep_id in task.dependencies}
+    deps = db.query(TaskDB).filter(TaskDB.id.in_(dep_ids)).all() if dep_ids else []
+    found = {dep.id: dep for dep in deps}
+    missing = dep_ids - found.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Task depends on non-existent tasks: {', '.join(sorted(missing))}"
+        )
+    
+    db_tasks = []
+    for task, task_id in zip(tasks, task_ids):
+        db_task = TaskDB(
+            id=task_id,
+            title=task.title,
+            due_date=task.due_date,
+            estimated_hours=task.estimated_hours,
+            importance=task.importance
+        )
+        db_task.dependencies.extend(found[dep_id] for dep_id in dict.fromkeys(task.dependencies))
+        db_tasks.append(db_task)
+    
+    # Validate dependencies (existence was checked above)
+    validate_tasks(db, db_tasks, task_ids=set(task_ids) | found.keys())
+    
+    # The dependencies now block the new tasks, so their stored scores are
+    # stale; update all of them in one statement
+    if deps:
+        new_dependents = count_dependents(db_tasks)
+        db.query(TaskDB).filter(TaskDB.id.in_(new_dependents)).update(
+            {
+                TaskDB.dependents_count: TaskDB.dependents_count + case(new_dependents, value=TaskDB.id, else_=0),
+                TaskDB.scored_on: None
+            },
+            synchronize_session=False
+        )
+    
+    return db_tasks
 
 @app.post("/api/tasks/", response_model=Task, status_code=status.HTTP_201_CREATED)
 def create_task(task: TaskBase, db: Session = Depends(get_db)):
     """Create a new task"""
     # Create task in database
-    db_task = TaskDB(
-        id=str(uuid.uuid4()),
-        title=task.title,
-        due_date=task.due_date,
-        estimated_hours=task.estimated_hours,
-        importance=task.importance
-    )
-    
-    # Add dependencies
-    for dep_id in task.dependencies:
-        dep_task = db.query(TaskDB).filter(TaskDB.id == dep_id).first()
-        if dep_task:
-            db_task.dependencies.append(dep_task)
-    
-    # Validate dependencies
-    validate_tasks(db, [db_task])
+    db_task, = build_db_tasks(db, [task], [uuid.uuid4().hex])
     
     # Add to database
     db.add(db_task)
@@ -265,12 +413,32 @@ def create_task(task: TaskBase, db: Session = Depends(get_db)):
     
     return task_db_to_pydantic(db_task)
 
+@app.post("/api/tasks/bulk/", response_model=List[Task], status_code=status.HTTP_201_CREATED)
+def create_tasks_bulk(request: BulkTaskCreate, db: Session = Depends(get_db)):
+    """
+    Create several tasks in one request and one transaction.
+    Dependencies must refer to existing tasks; tasks are returned in input order.
+    """
+    db_tasks = build_db_tasks(db, request.tasks, generate_task_ids(len(request.tasks)))
+    created = [task_db_to_pydantic(db_task) for db_task in db_tasks]
+    
+    db.add_all(db_tasks)
+    db.commit()
+    
+    return created
+
 @app.get("/api/tasks/", response_model=List[Task])
 def list_tasks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     """List all tasks"""
     tasks = db.query(TaskDB).offset(skip).limit(limit).all()
     return [task_db_to_pydantic(task) for task in tasks]
 
+@app.get("/api/tasks/ids/", response_model=List[TaskId])
+def list_task_ids(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    """List the IDs of all tasks"""
+    # Read the ids alone, without loading rows or their dependencies
+    return [TaskId.model_construct(id=task_id) for (task_id,) in db.query(TaskDB.id).offset(skip).limit(limit)]
+
 @app.get("/api/tasks/{task_id}", response_model=Task)
 def get_task(task_id: str, db: Session = Depends(get_db)):
     """Get a specific task by ID"""
@@ -280,18 +448,30 @@ def get_task(task_id: str, db: Session = Depends(get_db)):
     return task_db_to_pydantic(task)
 
 @app.post("/api/tasks/analyze/", response_model=AnalysisResponse)
-async def analyze_tasks(request: AnalysisRequest, db: Session = Depends(get_db)):
+def analyze_tasks(request: AnalysisRequest, db: Session = Depends(get_db)):
     """
     Analyze and prioritize a list of tasks
     """
-    # Get all tasks from the database
-    db_tasks = db.query(TaskDB).all()
+    today = date.today()
+    
+    # Get all tasks from the database, with dependencies loaded up front
+    db_tasks = db.query(TaskDB).options(
+        selectinload(TaskDB.dependencies),
+        selectinload(TaskDB.depends_on_me)
+    ).all()
+    db_task_map = {db_task.id: db_task for db_task in db_tasks}
     
     # If no tasks in request, use all tasks from database
     if not request.tasks:
-        tasks = [task_db_to_pydantic(task) for task in db_tasks]
+        tasks = [_ScoringTask.from_db(task) for task in db_tasks]
     else:
-        tasks = [Task(**task.dict()) for task in request.tasks]
+        # Request tasks were validated as TaskCreate; score them as plain records
+        task_ids = generate_task_ids(len(request.tasks))
+        tasks = [
+            _ScoringTask(task_id, task.title, task.due_date, task.estimated_hours,
+                         task.importance, tuple(task.dependencies), None, None)
+            for task, task_id in zip(request.tasks, task_ids)
+        ]
     
     if not tasks:
         return {"tasks": [], "strategy": "default", "weights": None}
@@ -302,72 +482,147 @@ async def analyze_tasks(request: AnalysisRequest, db: Session = Depends(get_db))
     # Add database tasks that aren't in the request
     for db_task in db_tasks:
         if db_task.id not in all_tasks:
-            all_tasks[db_task.id] = task_db_to_pydantic(db_task)
+            all_tasks[db_task.id] = _ScoringTask.from_db(db_task)
     
-    # Validate tasks and dependencies
-    validate_tasks(db, list(all_tasks.values()))
+    # Validate tasks and dependencies, counting dependents in the same pass
+    _, rev_count, _ = validate_tasks(db, list(all_tasks.values()))
     
     # Initialize priority calculator with provided weights or defaults
     calculator = PriorityCalculator(weights=request.weights)
     
-    # Calculate scores for all tasks
-    for task in tasks:
-        task.score = calculator.calculate_score(task, all_tasks)
-        task.explanation = calculator.generate_explanation(task, all_tasks)
-        
-        # Update task in database if it exists
-        db_task = db.query(TaskDB).filter(TaskDB.id == task.id).first()
-        if db_task:
-            db_task.score = task.score
-            db_task.explanation = task.explanation
+    # Calculate scores for all tasks in one batch
+    for task, score in zip(tasks, calculator.calculate_scores(tasks, rev_count, today)):
+        task.score = score
+        task.explanation = calculator.generate_explanation(task, all_tasks, rev_count, today)
     
-    db.commit()
+    # Persist scores of tasks that exist in the database in one bulk UPDATE;
+    # scores from custom weights are not reused by suggest_tasks
+    scored_on = None if request.weights else today
+    updates = [
+        {"id": task.id, "score": task.score, "explanation": task.explanation, "scored_on": scored_on}
+        for task in tasks if task.id in db_task_map
+    ]
+    if updates:
+        db.bulk_update_mappings(TaskDB, updates)
+        db.commit()
     
     # Sort tasks by score (descending)
     sorted_tasks = sorted(tasks, key=lambda x: x.score or 0, reverse=True)
     
     return {
-        "tasks": sorted_tasks,
+        "tasks": [task.to_task() for task in sorted_tasks],
         "strategy": "custom" if request.weights else "default",
-        "weights": request.weights.dict() if request.weights else None
+        "weights": calculator.weights_dict if request.weights else None
     }
 
 @app.get("/api/tasks/suggest/", response_model=List[Task])
-async def suggest_tasks(db: Session = Depends(get_db)):
+def suggest_tasks(db: Session = Depends(get_db)):
     """
-    Get top 3 suggested tasks to work on today
+    Get top 3 suggested tasks to work on today.
+    Only tasks that are ready (no pending dependencies) are considered.
     """
-    # Get all tasks that aren't completed
-    tasks = db.query(TaskDB).all()
+    today = date.today()
     
-    if not tasks:
-        return []
-    
-    # Convert to Pydantic models
-    task_models = [task_db_to_pydantic(task) for task in tasks]
-    
-    # Create task map for dependency checking
-    task_map = {task.id: task for task in task_models}
+    # Completed tasks are deleted with their links, so a task is ready to work
+    # on when it has no remaining dependency rows
+    ready = ~exists().where(task_dependencies.c.task_id == TaskDB.id)
     
-    # Initialize calculator with default weights
-    calculator = PriorityCalculator()
-    
-    # Calculate scores
-    for task in task_models:
-        task.score = calculator.calculate_score(task, task_map)
+    # Rescore ready tasks whose stored score is missing or was not computed today
+    stale = db.query(TaskDB).filter(
+        ready,
+        or_(TaskDB.scored_on.is_(None), TaskDB.scored_on != today)
+    ).all()
+    if stale:
+        # Dependents are counted as tasks are created and deleted
+        rev_count = {task.id: task.dependents_count for task in stale}
+        
+        # Initialize calculator with default weights
+        calculator = PriorityCalculator()
+        scores = calculator.calculate_scores(stale, rev_count, today)
+        db.bulk_update_mappings(TaskDB, [
+            {"id": task.id, "score": score, "scored_on": today}
+            for task, score in zip(stale, scores)
+        ])
+        db.commit()
     
-    # Sort by score (descending) and take top 3
-    suggested = sorted(task_models, key=lambda x: x.score or 0, reverse=True)[:3]
+    # Take the top 3 ready tasks straight from the score index; on equal
+    # scores, tasks that unblock more work come first
+    suggested = (
+        db.query(TaskDB)
+        .filter(ready)
+        .order_by(TaskDB.score.desc(), TaskDB.dependents_count.desc())
+        .limit(3)
+        .all()
+    )
     
-    return suggested
+    return [task_db_to_pydantic(task) for task in suggested]
 
 # Create database tables on startup
 @app.on_event("startup")
 def startup_event():
     init_db()
 
+@app.delete("/api/tasks/bulk/", status_code=status.HTTP_204_NO_CONTENT)
+def delete_tasks_bulk(request: BulkTaskDelete, db: Session = Depends(get_db)):
+    """
+    Mark several tasks as complete by deleting them in one transaction.
+    Tasks may depend on each other, but not be depended on by tasks outside the request.
+    """
+    ids = set(request.ids)
+    if not ids:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    try:
+        found = {task_id for (task_id,) in db.query(TaskDB.id).filter(TaskDB.id.in_(ids))}
+        missing = ids - found
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Tasks not found: {', '.join(sorted(missing))}")
+        
+        # Count dependents left behind by the request in one GROUP BY on the link table
+        blocked = dict(
+            db.query(task_dependencies.c.depends_on_id, func.count())
+            .filter(task_dependencies.c.depends_on_id.in_(ids), task_dependencies.c.task_id.notin_(ids))
+            .group_by(task_dependencies.c.depends_on_id)
+            .all()
+        )
+        if blocked:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "message": "Cannot complete tasks with dependent tasks",
+                    "dependents": blocked
+                }
+            )
+        
+        # Remaining dependencies lose their dependents from the request, so
+        # their stored scores are stale
+        removed_links = (
+            select(func.count())
+            .select_from(task_dependencies)
+            .where(task_dependencies.c.depends_on_id == TaskDB.id, task_dependencies.c.task_id.in_(ids))
+            .scalar_subquery()
+        )
+        db.query(TaskDB).filter(
+            TaskDB.id.notin_(ids),
+            TaskDB.id.in_(select(task_dependencies.c.depends_on_id).where(task_dependencies.c.task_id.in_(ids)))
+        ).update(
+            {TaskDB.dependents_count: TaskDB.dependents_count - removed_links, TaskDB.scored_on: None},
+            synchronize_session=False
+        )
+        
+        # Delete the links first, foreign keys are enforced
+        db.execute(task_dependencies.delete().where(task_dependencies.c.task_id.in_(ids)))
+        db.query(TaskDB).filter(TaskDB.id.in_(ids)).delete(synchronize_session=False)
+        db.commit()
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.delete("/api/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(task_id: str, db: Session = Depends(get_db)):
+def delete_task(task_id: str, db: Session = Depends(get_db)):
     """
     Mark a task as complete by deleting it
     """
@@ -377,27 +632,44 @@ async def delete_task(task_id: str, db: Session = Depends(get_db)):
         if not task:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        # Check if there are tasks that depend on this one
-        dependent_tasks = []
-        for t in db.query(TaskDB).all():
-            if task_id in (t.dependencies or []):
-                dependent_tasks.append(t)
+        # Check if there are tasks that depend on this one (indexed lookup on the link table)
+        dependent_titles = [
+            title for (title,) in db.query(TaskDB.title)
+            .join(task_dependencies, TaskDB.id == task_dependencies.c.task_id)
+            .filter(task_dependencies.c.depends_on_id == task_id)
+            .limit(3)  # Show first 3 for brevity
+        ]
         
-        if dependent_tasks:
-            dependent_titles = [t.title for t in dependent_tasks[:3]]  # Show first 3 for brevity
+        if dependent_titles:
+            total_dependents = (
+                db.query(func.count())
+                .select_from(task_dependencies)
+                .filter(task_dependencies.c.depends_on_id == task_id)
+                .scalar()
+            )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
                     "message": "Cannot complete task with dependent tasks",
                     "dependent_tasks": dependent_titles,
-                    "total_dependents": len(dependent_tasks)
+                    "total_dependents": total_dependents
                 }
             )
         
+        # Its dependencies lose a dependent, so their stored scores are stale
+        dep_ids = [dep.id for dep in task.dependencies]
+        if dep_ids:
+            db.query(TaskDB).filter(TaskDB.id.in_(dep_ids)).update(
+                {TaskDB.dependents_count: TaskDB.dependents_count - 1, TaskDB.scored_on: None},
+                synchronize_session=False
+            )
+        
         # Delete the task
         db.delete(task)
         db.commit()
         return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,11 +1,90 @@
+import os
 import sys
 import json
+import orjson
 import requests
+from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from datetime import date, timedelta
 
 # Base URL for the API
 BASE_URL = "http://127.0.0.1:8000/api"
 
+# Due dates used by the test tasks
+TODAY = date.today()
+TOMORROW_ISO = (TODAY + timedelta(days=1)).isoformat()
+IN_TWO_DAYS_ISO = (TODAY + timedelta(days=2)).isoformat()
+NEXT_WEEK_ISO = (TODAY + timedelta(days=7)).isoformat()
+IN_TWO_WEEKS_ISO = (TODAY + timedelta(days=14)).isoformat()
+
+# USE_MOCK_API=1 replays recorded responses without a server;
+# USE_MOCK_API=record runs against the server and records them
+MOCK_MODE = os.environ.get("USE_MOCK_API", "")
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tests", "fixtures", "api", "test_all.json")
+
+class RecordReplayAdapter(HTTPAdapter):
+    """Transport adapter that records responses to a JSON fixture or replays them
+
+    Responses are keyed by method, URL and how many times that pair was
+    requested before. Request bodies are not part of the key because they
+    carry due dates relative to today.
+    """
+    def __init__(self, path, record=False, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.record = record
+        self.calls = defaultdict(int)
+        if record:
+            self.fixtures = {}
+        else:
+            with open(path, encoding="utf-8") as f:
+                self.fixtures = json.load(f)
+    
+    def send(self, request, **kwargs):
+        call = f"{request.method} {request.url}"
+        key = f"{call} #{self.calls[call]}"
+        self.calls[call] += 1
+        
+        if self.record:
+            response = super().send(request, **kwargs)
+            self.fixtures[key] = {
+                "status_code": response.status_code,
+                "headers": {"Content-Type": response.headers.get("Content-Type", "")},
+                "body": response.text
+            }
+            return response
+        
+        if key not in self.fixtures:
+            raise requests.exceptions.ConnectionError(f"No recorded response for {key}", request=request)
+        recorded = self.fixtures[key]
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response._content = recorded["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+    
+    def close(self):
+        if self.record:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.fixtures, f, indent=2, ensure_ascii=False)
+        super().close()
+
+# Shared session so every call reuses one keep-alive connection to the server
+SESSION = requests.Session()
+if MOCK_MODE:
+    SESSION.mount("http://", RecordReplayAdapter(FIXTURE_PATH, record=(MOCK_MODE == "record"),
+                                                pool_connections=1, pool_maxsize=10))
+else:
+    SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+def _json(response):
+    return orjson.loads(response.content)
+
 def print_test_header(test_name):
     print(f"\n{'='*50}")
     print(f"TEST: {test_name}")
@@ -25,23 +104,37 @@ def test_create_task(title, due_date, importance, estimated_hours, dependencies=
     }
     
     print(f"Creating task: {title}")
-    response = requests.post(f"{BASE_URL}/tasks/", json=task_data)
+    response = SESSION.post(f"{BASE_URL}/tasks/", json=task_data)
     
     if response.status_code == 200:
-        task = response.json()
+        task = _json(response)
         print(f"[OK] Task created successfully (ID: {task['id']})")
         return task
     else:
         print(f"[X] Failed to create task: {response.text}")
         return None
 
+def create_tasks_bulk(task_dicts):
+    """Test creating several tasks with a single bulk request"""
+    print(f"Creating {len(task_dicts)} tasks in one request")
+    response = SESSION.post(f"{BASE_URL}/tasks/bulk/", json={"tasks": task_dicts})
+    
+    if response.status_code == 201:
+        tasks = _json(response)
+        for task in tasks:
+            print(f"[OK] Task created successfully: {task['title']} (ID: {task['id']})")
+        return tasks
+    else:
+        print(f"[X] Failed to create tasks: {response.text}")
+        return [None] * len(task_dicts)
+
 def test_get_tasks():
     """Test getting all tasks"""
     print("Fetching all tasks...")
-    response = requests.get(f"{BASE_URL}/tasks/")
+    response = SESSION.get(f"{BASE_URL}/tasks/")
     
     if response.status_code == 200:
-        tasks = response.json()
+        tasks = _json(response)
         print(f"[OK] Retrieved {len(tasks)} tasks")
         for task in tasks:
             print(f"  - {task['title']} (ID: {task['id']}, Score: {task.get('score', 'N/A')})")
@@ -50,13 +143,21 @@ def test_get_tasks():
         print(f"[X] Failed to fetch tasks: {response.text}")
         return []
 
+def _get_task_ids():
+    """Fetch only the IDs of all tasks"""
+    response = SESSION.get(f"{BASE_URL}/tasks/ids/")
+    if response.status_code == 200:
+        return [task["id"] for task in _json(response)]
+    print(f"[X] Failed to fetch task IDs: {response.text}")
+    return []
+
 def test_get_suggestions():
     """Test getting task suggestions"""
     print("\nGetting task suggestions...")
-    response = requests.get(f"{BASE_URL}/tasks/suggest/")
+    response = SESSION.get(f"{BASE_URL}/tasks/suggest/")
     
     if response.status_code == 200:
-        suggestions = response.json()
+        suggestions = _json(response)
         print(f"[OK] Retrieved {len(suggestions)} suggestions")
         for i, task in enumerate(suggestions, 1):
             print(f"  {i}. {task['title']} (Score: {task.get('score', 'N/A')})")
@@ -68,7 +169,7 @@ def test_get_suggestions():
 def test_complete_task(task_id, expect_success=True):
     """Test marking a task as complete"""
     print(f"\nMarking task {task_id} as complete...")
-    response = requests.delete(f"{BASE_URL}/tasks/{task_id}")
+    response = SESSION.delete(f"{BASE_URL}/tasks/{task_id}")
     
     if expect_success:
         if response.status_code == 204:  # 204 No Content is expected for successful deletion
@@ -85,6 +186,18 @@ def test_complete_task(task_id, expect_success=True):
             print(f"[X] Task {task_id} was unexpectedly completed: {response.status_code} - {response.text}")
             return False
 
+def complete_tasks_bulk(task_ids):
+    """Test marking several tasks as complete with a single bulk request"""
+    print(f"Marking {len(task_ids)} tasks as complete in one request...")
+    response = SESSION.delete(f"{BASE_URL}/tasks/bulk/", json={"ids": task_ids})
+    
+    if response.status_code == 204:
+        print(f"[OK] {len(task_ids)} tasks marked as complete")
+        return True
+    else:
+        print(f"[X] Failed to mark tasks as complete: {response.status_code} - {response.text}")
+        return False
+
 def run_comprehensive_test():
     """Run a comprehensive test of all functionality"""
     print("\n" + "="*60)
@@ -93,46 +206,48 @@ def run_comprehensive_test():
     
     # Clear existing tasks
     print("Clearing existing tasks...")
-    tasks = test_get_tasks()
-    for task in tasks:
-        test_complete_task(task['id'])
+    complete_tasks_bulk(_get_task_ids())
     
     # Test 1: Create tasks with different priorities and due dates
     print_test_header("1. Creating Test Tasks")
-    today = date.today()
-    
-    # High importance, due soon
-    task1 = test_create_task(
-        "Prepare project presentation", 
-        today + timedelta(days=1), 
-        importance=9,
-        estimated_hours=4
-    )
-    
-    # Medium importance, due in a week
-    task2 = test_create_task(
-        "Review team's pull requests",
-        today + timedelta(days=7),
-        importance=6,
-        estimated_hours=2
-    )
-    
-    # Low importance, not urgent
-    task3 = test_create_task(
-        "Update project documentation",
-        today + timedelta(days=14),
-        importance=3,
-        estimated_hours=3
-    )
-    
-    # Depends on task1
-    task4 = test_create_task(
-        "Submit final report",
-        today + timedelta(days=2),
-        importance=8,
-        estimated_hours=2,
-        dependencies=[task1['id']] if task1 else []
-    )
+    # Independent tasks in one batch
+    task1, task2, task3 = create_tasks_bulk([
+        # High importance, due soon
+        {
+            "title": "Prepare project presentation",
+            "due_date": TOMORROW_ISO,
+            "importance": 9,
+            "estimated_hours": 4,
+            "dependencies": []
+        },
+        # Medium importance, due in a week
+        {
+            "title": "Review team's pull requests",
+            "due_date": NEXT_WEEK_ISO,
+            "importance": 6,
+            "estimated_hours": 2,
+            "dependencies": []
+        },
+        # Low importance, not urgent
+        {
+            "title": "Update project documentation",
+            "due_date": IN_TWO_WEEKS_ISO,
+            "importance": 3,
+            "estimated_hours": 3,
+            "dependencies": []
+        }
+    ])
+    
+    # Depends on task1, so it goes in a second batch that references task1's ID
+    task4, = create_tasks_bulk([
+        {
+            "title": "Submit final report",
+            "due_date": IN_TWO_DAYS_ISO,
+            "importance": 8,
+            "estimated_hours": 2,
+            "dependencies": [task1['id']] if task1 else []
+        }
+    ])
     
     # Test 2: Get all tasks
     print_test_header("2. Listing All Tasks")
@@ -192,3 +307,5 @@ if __name__ == "__main__":
     except requests.exceptions.RequestException as e:
         print(f"\nError: Could not connect to the API. Is the server running? ({e})")
         sys.exit(1)
+    finally:
+        SESSION.close()
@@ -1,55 +1,84 @@
+import orjson
 import pytest
-import httpx
-import uvicorn
-import threading
-import time
 from datetime import date, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy import event
 
-# Start the FastAPI server in a separate thread
-def start_server():
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, log_level="info")
+from main import app
+from database import get_db
 
-@pytest.fixture(scope="module")
-def server():
-    server_thread = threading.Thread(target=start_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Give the server time to start
-    yield
-    # No need to explicitly stop the server as it's a daemon thread
+def _json(response):
+    return orjson.loads(response.content)
+
+# Test data
+TODAY = date.today()
+TODAY_ISO = TODAY.isoformat()
+TOMORROW_ISO = (TODAY + timedelta(days=1)).isoformat()
+YESTERDAY_ISO = (TODAY - timedelta(days=1)).isoformat()
+NEXT_WEEK_ISO = (TODAY + timedelta(weeks=1)).isoformat()
+IN_TWO_WEEKS_ISO = (TODAY + timedelta(weeks=2)).isoformat()
+
+# Fields shared by the test tasks; each test adds a title and due date
+_TASK_TEMPLATE = {
+    "estimated_hours": 1,
+    "importance": 5,
+    "dependencies": []
+}
+
+DEFAULT_WEIGHTS = {
+    "urgency": 0.4,
+    "importance": 0.3,
+    "effort": 0.2,
+    "dependencies": 0.1
+}
+IMPORTANCE_WEIGHTS = {
+    "urgency": 0.4,
+    "importance": 0.4,
+    "effort": 0.1,
+    "dependencies": 0.1
+}
+
+@pytest.fixture
+def client(db_session):
+    # Dispatch requests straight into the ASGI app; every request in a test
+    # shares that test's session, which is rolled back afterwards
+    app.dependency_overrides[get_db] = lambda: db_session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
 
 @pytest.fixture
-def client():
-    return httpx.Client(base_url="http://localhost:8000")
+def statements(db_engine):
+    # SQL statements sent to the test database while the fixture is active
+    recorded = []
+    def record(conn, cursor, statement, parameters, context, executemany):
+        recorded.append(statement)
+    event.listen(db_engine, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_engine, "before_cursor_execute", record)
 
 def test_analyze_tasks_priority_scoring(client):
     task1 = {
+        **_TASK_TEMPLATE,
         "title": "High priority task",
-        "due_date": (date.today() + timedelta(days=1)).isoformat(),
+        "due_date": TOMORROW_ISO,
         "estimated_hours": 2,
-        "importance": 9,
-        "dependencies": []
+        "importance": 9
     }
     
     task2 = {
+        **_TASK_TEMPLATE,
         "title": "Medium priority task",
-        "due_date": (date.today() + timedelta(weeks=1)).isoformat(),
-        "estimated_hours": 4,
-        "importance": 5,
-        "dependencies": []
+        "due_date": NEXT_WEEK_ISO,
+        "estimated_hours": 4
     }
     
     response = client.post("/api/tasks/analyze/", json={
         "tasks": [task1, task2],
-        "weights": {
-            "urgency": 0.4,
-            "importance": 0.3,
-            "effort": 0.2,
-            "dependencies": 0.1
-        }
+        "weights": DEFAULT_WEIGHTS
     })
     
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert len(data["tasks"]) == 2
     # High priority task should have higher score
     assert data["tasks"][0]["score"] > data["tasks"][1]["score"]
@@ -58,35 +87,30 @@ def test_analyze_tasks_with_weights(client):
     # Test data with different priorities
     tasks = [
         {
+            **_TASK_TEMPLATE,
             "title": "High importance, urgent task",
-            "due_date": (date.today() + timedelta(days=1)).isoformat(),
+            "due_date": TOMORROW_ISO,
             "estimated_hours": 2,
-            "importance": 9,
-            "dependencies": []
+            "importance": 9
         },
         {
+            **_TASK_TEMPLATE,
             "title": "Low importance, not urgent task",
-            "due_date": (date.today() + timedelta(weeks=2)).isoformat(),
+            "due_date": IN_TWO_WEEKS_ISO,
             "estimated_hours": 4,
-            "importance": 3,
-            "dependencies": []
+            "importance": 3
         }
     ]
 
     # Test with default weights
     response = client.post("/api/tasks/analyze/", json={
         "tasks": tasks,
-        "weights": {
-            "urgency": 0.4,
-            "importance": 0.4,
-            "effort": 0.1,
-            "dependencies": 0.1
-        }
+        "weights": IMPORTANCE_WEIGHTS
     })
     
     assert response.status_code == 200, f"Expected status code 200, but got {response.status_code}. Response: {response.text}"
     
-    data = response.json()
+    data = _json(response)
     assert "tasks" in data
     assert len(data["tasks"]) == 2
     
@@ -105,33 +129,158 @@ def test_get_task_suggestions(client):
     # First, add some test tasks
     tasks = [
         {
+            **_TASK_TEMPLATE,
             "title": "Urgent task",
-            "due_date": date.today().isoformat(),
+            "due_date": TODAY_ISO,
             "estimated_hours": 2,
-            "importance": 8,
-            "dependencies": []
+            "importance": 8
         },
         {
+            **_TASK_TEMPLATE,
             "title": "Important but not urgent",
-            "due_date": (date.today() + timedelta(weeks=1)).isoformat(),
+            "due_date": NEXT_WEEK_ISO,
             "estimated_hours": 4,
-            "importance": 9,
-            "dependencies": []
+            "importance": 9
         }
     ]
     
-    # Add tasks
-    for task in tasks:
-        response = client.post("/api/tasks/", json=task)
-        assert response.status_code in [200, 201]
+    # Add tasks in one request
+    response = client.post("/api/tasks/bulk/", json={"tasks": tasks})
+    assert response.status_code == 201
+    assert [task["title"] for task in _json(response)] == [task["title"] for task in tasks]
     
     # Get suggestions
     response = client.get("/api/tasks/suggest/")
     assert response.status_code == 200
-    suggestions = response.json()
+    suggestions = _json(response)
     assert isinstance(suggestions, list)
     # Should return at most 3 suggestions
     assert len(suggestions) <= 3
     # Should return at least one suggestion if there are tasks
     if tasks:
-        assert len(suggestions) > 0
\ No newline at end of file
+        assert len(suggestions) > 0
+
+def test_analyze_tasks_rejects_unknown_dependency(client):
+    task = {
+        **_TASK_TEMPLATE,
+        "title": "Depends on a missing task",
+        "due_date": TODAY_ISO,
+        "dependencies": ["does-not-exist"]
+    }
+    
+    response = client.post("/api/tasks/analyze/", json={"tasks": [task]})
+    assert response.status_code == 400
+    assert "non-existent task does-not-exist" in _json(response)["detail"]
+
+def test_suggestions_track_dependents(client):
+    blocker = _json(client.post("/api/tasks/", json={
+        **_TASK_TEMPLATE,
+        "title": "Blocking task",
+        "due_date": YESTERDAY_ISO,
+        "importance": 10
+    }))
+    dependent = _json(client.post("/api/tasks/", json={
+        **_TASK_TEMPLATE,
+        "title": "Blocked task",
+        "due_date": TODAY_ISO,
+        "dependencies": [blocker["id"]]
+    }))
+    
+    # The blocked task is not ready, the blocker gets the dependency bonus
+    suggestions = _json(client.get("/api/tasks/suggest/"))
+    assert dependent["id"] not in [task["id"] for task in suggestions]
+    assert suggestions[0]["id"] == blocker["id"]
+    blocking_score = suggestions[0]["score"]
+    
+    # Completing the dependent removes the bonus
+    assert client.delete(f"/api/tasks/{dependent['id']}").status_code == 204
+    suggestions = _json(client.get("/api/tasks/suggest/"))
+    assert suggestions[0]["id"] == blocker["id"]
+    assert suggestions[0]["score"] < blocking_score
+
+def test_list_task_ids(client):
+    created = _json(client.post("/api/tasks/bulk/", json={"tasks": [
+        {**_TASK_TEMPLATE, "title": "Listed first", "due_date": TOMORROW_ISO},
+        {**_TASK_TEMPLATE, "title": "Listed second", "due_date": NEXT_WEEK_ISO}
+    ]}))
+    
+    response = client.get("/api/tasks/ids/")
+    assert response.status_code == 200
+    ids = _json(response)
+    assert all(list(task) == ["id"] for task in ids)
+    assert {task["id"] for task in created} <= {task["id"] for task in ids}
+    
+    full = _json(client.get("/api/tasks/"))
+    assert {task["id"] for task in ids} == {task["id"] for task in full}
+    
+    # Each route documents a single response shape
+    paths = _json(client.get("/openapi.json"))["paths"]
+    schema = paths["/api/tasks/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert schema["items"] == {"$ref": "#/components/schemas/Task"}
+    schema = paths["/api/tasks/ids/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert schema["items"] == {"$ref": "#/components/schemas/TaskId"}
+
+def test_delete_tasks_bulk(client):
+    first, second, third = _json(client.post("/api/tasks/bulk/", json={"tasks": [
+        {**_TASK_TEMPLATE, "title": "Bulk first", "due_date": TOMORROW_ISO},
+        {**_TASK_TEMPLATE, "title": "Bulk second", "due_date": TOMORROW_ISO},
+        {**_TASK_TEMPLATE, "title": "Bulk third", "due_date": TOMORROW_ISO}
+    ]}))
+    dependent = _json(client.post("/api/tasks/", json={
+        **_TASK_TEMPLATE, "title": "Bulk dependent", "due_date": TOMORROW_ISO,
+        "dependencies": [first["id"], second["id"]]
+    }))
+    
+    # The dependent stays behind, so its dependencies cannot be completed
+    response = client.request("DELETE", "/api/tasks/bulk/", json={"ids": [first["id"], third["id"]]})
+    assert response.status_code == 400
+    assert _json(response)["detail"]["dependents"] == {first["id"]: 1}
+    
+    response = client.request("DELETE", "/api/tasks/bulk/", json={"ids": [first["id"], "does-not-exist"]})
+    assert response.status_code == 404
+    
+    # Completing the dependent together with one of its dependencies is allowed
+    response = client.request("DELETE", "/api/tasks/bulk/", json={"ids": [first["id"], third["id"], dependent["id"]]})
+    assert response.status_code == 204
+    remaining = {task["id"] for task in _json(client.get("/api/tasks/ids/"))}
+    assert second["id"] in remaining
+    assert not remaining & {first["id"], third["id"], dependent["id"]}
+    
+    # The surviving dependency no longer blocks anything
+    assert client.delete(f"/api/tasks/{second['id']}").status_code == 204
+
+def test_statement_count_does_not_grow_with_tasks(client, statements):
+    def count(method, url, **kwargs):
+        statements.clear()
+        response = client.request(method, url, **kwargs)
+        assert response.status_code < 300, response.text
+        return len(statements), response
+    
+    def add_tasks(n, dependencies=()):
+        return count("POST", "/api/tasks/bulk/", json={"tasks": [
+            {**_TASK_TEMPLATE, "title": f"Task {i}", "due_date": TOMORROW_ISO, "dependencies": list(dependencies)}
+            for i in range(n)
+        ]})
+    
+    def measure(dependencies):
+        created, response = add_tasks(1, dependencies)
+        task_id = _json(response)[0]["id"]
+        return [created] + [
+            count(method, url, **kwargs)[0] for method, url, kwargs in [
+                ("GET", "/api/tasks/", {}),
+                ("POST", "/api/tasks/analyze/", {"json": {"tasks": []}}),
+                ("GET", "/api/tasks/suggest/", {}),
+                ("DELETE", f"/api/tasks/{task_id}", {}),
+            ]
+        ]
+    
+    # A few tasks blocked by one root, then many more blocked by several
+    # roots; eager loading keeps every path at a fixed number of statements
+    roots = [task["id"] for task in _json(add_tasks(3)[1])]
+    add_tasks(2, roots[:1])
+    small = measure(roots[:1])
+    
+    add_tasks(20, roots)
+    large = measure(roots)
+    
+    assert small == large
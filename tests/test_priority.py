@@ -0,0 +1,38 @@
+import pytest
+from datetime import date, timedelta
+from database import TaskDB
+
+# Test data
+today = date.today()
+
+# (due in days, importance, estimated hours) of a task that should outrank
+# the second task in the case
+CASES = [
+    # High importance and due soon vs low importance and not urgent
+    ((1, 9, 2), (14, 3, 1)),
+    # Same due date, higher importance wins
+    ((3, 8, 2), (3, 4, 2)),
+    # Same importance, earlier due date wins
+    ((0, 5, 2), (7, 5, 2)),
+]
+
+@pytest.mark.parametrize("higher,lower", CASES)
+def test_priority_calculation(calculator, higher, lower):
+    # Create test tasks
+    task1, task2 = [
+        TaskDB(
+            id=f"test{n}",
+            title=f"Test task {n}",
+            due_date=today + timedelta(days=due_in),
+            estimated_hours=hours,
+            importance=importance
+        )
+        for n, (due_in, importance, hours) in enumerate((higher, lower), start=1)
+    ]
+    tasks = {"test1": task1, "test2": task2}
+    
+    # Calculate priorities
+    task1_score = calculator.calculate_score(task1, tasks)
+    task2_score = calculator.calculate_score(task2, tasks)
+    
+    assert task1_score > task2_score, f"{higher} should outrank {lower}: {task1_score} vs {task2_score}"
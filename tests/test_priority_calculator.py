@@ -1,6 +1,7 @@
 import pytest
 from datetime import date, timedelta
-from main import PriorityCalculator
+from fastapi import HTTPException
+from main import Task, analyze_graph, count_dependents
 from database import TaskDB, get_db, init_db
 from sqlalchemy.orm import Session
 
@@ -8,53 +9,28 @@ from sqlalchemy.orm import Session
 today = date.today()
 tomorrow = today + timedelta(days=1)
 yesterday = today - timedelta(days=1)
+next_week = today + timedelta(days=7)
 
-# Fixture for database session
-@pytest.fixture(scope="module")
-def db_session():
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    
-    # Use in-memory SQLite for testing
-    TEST_DATABASE_URL = "sqlite:///:memory:"
-    engine = create_engine(TEST_DATABASE_URL)
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    
-    # Create tables
-    from database import Base
-    Base.metadata.create_all(bind=engine)
-    
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-        Base.metadata.drop_all(bind=engine)
+def make_task(task_id, title, due_date=tomorrow, estimated_hours=4, importance=5):
+    """Build an unsaved task row with defaults for the fields a test does not vary"""
+    return TaskDB(
+        id=task_id,
+        title=title,
+        due_date=due_date,
+        estimated_hours=estimated_hours,
+        importance=importance
+    )
 
 # Test cases for PriorityCalculator
-def test_priority_calculation_high_importance():
+def test_priority_calculation_high_importance(calculator):
     """Test that high importance tasks get higher scores"""
-    calculator = PriorityCalculator()
-    
     # High importance task
-    high_importance_task = TaskDB(
-        id="1",
-        title="Important Task",
-        due_date=tomorrow,
-        estimated_hours=4,
-        importance=9  # High importance
-    )
+    high_importance_task = make_task("1", "Important Task", importance=9)
     
     # Lower importance task
-    low_importance_task = TaskDB(
-        id="2",
-        title="Less Important Task",
-        due_date=tomorrow,
-        estimated_hours=4,
-        importance=3  # Low importance
-    )
+    low_importance_task = make_task("2", "Less Important Task", importance=3)
     
-    tasks = {task.id: task for task in [high_importance_task, low_importance_task]}
+    tasks = {"1": high_importance_task, "2": low_importance_task}
     
     # Calculate scores
     high_score = calculator.calculate_score(high_importance_task, tasks)
@@ -64,29 +40,15 @@ def test_priority_calculation_high_importance():
     assert high_score > low_score
     assert high_importance_task.importance > low_importance_task.importance
 
-def test_priority_calculation_urgency():
+def test_priority_calculation_urgency(calculator):
     """Test that urgent tasks get higher scores"""
-    calculator = PriorityCalculator()
-    
     # Task due today
-    urgent_task = TaskDB(
-        id="3",
-        title="Urgent Task",
-        due_date=today,
-        estimated_hours=4,
-        importance=5
-    )
+    urgent_task = make_task("3", "Urgent Task", due_date=today)
     
     # Task due in a week
-    non_urgent_task = TaskDB(
-        id="4",
-        title="Not Urgent Task",
-        due_date=today + timedelta(days=7),
-        estimated_hours=4,
-        importance=5
-    )
+    non_urgent_task = make_task("4", "Not Urgent Task", due_date=next_week)
     
-    tasks = {task.id: task for task in [urgent_task, non_urgent_task]}
+    tasks = {"3": urgent_task, "4": non_urgent_task}
     
     # Calculate scores
     urgent_score = calculator.calculate_score(urgent_task, tasks)
@@ -95,66 +57,45 @@ def test_priority_calculation_urgency():
     # Urgent task should have a higher score
     assert urgent_score > non_urgent_score
 
-def test_priority_calculation_dependencies():
+def test_priority_calculation_dependencies(calculator):
     """Test that tasks with dependencies get appropriate scores"""
-    calculator = PriorityCalculator()
-    
     # Create tasks with dependencies
-    task_a = TaskDB(
-        id="5",
-        title="Task A",
-        due_date=tomorrow,
-        estimated_hours=2,
-        importance=5
-    )
-    
-    task_b = TaskDB(
-        id="6",
-        title="Task B",
-        due_date=tomorrow,
-        estimated_hours=2,
-        importance=5
-    )
+    task_a = make_task("5", "Task A", estimated_hours=2)
+    task_b = make_task("6", "Task B", estimated_hours=2)
     
     # Task C depends on A and B
-    task_c = TaskDB(
-        id="7",
-        title="Task C (depends on A and B)",
-        due_date=tomorrow,
-        estimated_hours=2,
-        importance=5
-    )
+    task_c = make_task("7", "Task C (depends on A and B)", estimated_hours=2)
     
     # Set up dependencies
     task_c.dependencies = [task_a, task_b]
     
-    tasks = {task.id: task for task in [task_a, task_b, task_c]}
+    tasks = {"5": task_a, "6": task_b, "7": task_c}
+    
+    # Count dependents once and reuse it for every task
+    dependents = count_dependents(tasks.values())
+    assert dependents == {"5": 1, "6": 1}
     
     # Calculate scores
-    score_a = calculator.calculate_score(task_a, tasks)
-    score_b = calculator.calculate_score(task_b, tasks)
-    score_c = calculator.calculate_score(task_c, tasks)
+    score_a = calculator.calculate_score(task_a, tasks, dependents)
+    score_b = calculator.calculate_score(task_b, tasks, dependents)
+    score_c = calculator.calculate_score(task_c, tasks, dependents)
     
     # Tasks that are depended upon should have higher scores
     assert score_a > score_c
     assert score_b > score_c
     
+    # Batch scoring matches per-task scoring
+    assert calculator.calculate_scores([task_a, task_b, task_c], dependents) == [score_a, score_b, score_c]
+    
     # Test explanation includes dependency information
-    explanation = calculator.generate_explanation(task_a, tasks)
+    explanation = calculator.generate_explanation(task_a, tasks, dependents)
     assert "Blocks 1 other task" in explanation
 
-def test_priority_calculation_past_due():
+def test_priority_calculation_past_due(calculator):
     """Test that past due tasks get high urgency scores"""
-    calculator = PriorityCalculator()
-    
     # Past due task
-    past_due_task = TaskDB(
-        id="8",
-        title="Past Due Task",
-        due_date=yesterday,
-        estimated_hours=2,
-        importance=3  # Even with low importance, should be high priority
-    )
+    # Even with low importance, should be high priority
+    past_due_task = make_task("8", "Past Due Task", due_date=yesterday, estimated_hours=2, importance=3)
     
     tasks = {"8": past_due_task}
     
@@ -167,3 +108,34 @@ def test_priority_calculation_past_due():
     # Test explanation mentions it's past due
     explanation = calculator.generate_explanation(past_due_task, tasks)
     assert "Past due by 1 days" in explanation
+
+def test_urgency_and_effort_score_boundaries(calculator):
+    """Test the urgency and effort lookup tables at each threshold"""
+    urgency = {-5: 100, -1: 100, 0: 90, 1: 80, 2: 70, 3: 70, 4: 50, 7: 50,
+               8: 30, 14: 30, 15: 20, 30: 20, 31: 10, 365: 10}
+    for days, expected in urgency.items():
+        assert calculator._calculate_urgency_score(today + timedelta(days=days), today) == expected
+    
+    effort = {0.5: 100, 1: 100, 1.5: 80, 4: 80, 4.5: 60, 8: 60, 9: 40, 16: 40, 16.5: 20, 100: 20}
+    for hours, expected in effort.items():
+        assert calculator._calculate_effort_score(hours) == expected
+
+def test_analyze_graph_orders_dependencies_first():
+    """Test that the dependency graph is sorted with dependencies first and cycles are rejected"""
+    def make(task_id, dependencies):
+        return Task(id=task_id, title=task_id, due_date=today, estimated_hours=1,
+                    importance=5, dependencies=dependencies)
+    
+    topo_order, rev_count, _ = analyze_graph([make("c", ["a", "b"]), make("b", ["a"]), make("a", [])])
+    assert topo_order == ["a", "b", "c"]
+    assert rev_count == {"a": 2, "b": 1}
+    
+    # No edges between the tasks takes the shortcut and keeps input order
+    topo_order, rev_count, _ = analyze_graph([make("x", []), make("y", ["external"])])
+    assert topo_order == ["x", "y"]
+    assert rev_count == {"external": 1}
+    
+    with pytest.raises(HTTPException) as exc_info:
+        analyze_graph([make("a", ["b"]), make("b", ["a"]), make("c", [])])
+    assert exc_info.value.status_code == 400
+    assert "Circular dependency" in exc_info.value.detail